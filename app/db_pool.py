@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import queue
+import sqlite3
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db import bind_request_conn, get_db_path, open_connection, unbind_request_conn
+
+# Requests under these prefixes never touch the database.
+_SKIP_PATHS = ("/static/", "/ui/assets/", "/health")
+
+
+def get_pool_size() -> int:
+    # SQLite serializes writers anyway; a handful of connections covers a household.
+    return int(os.getenv("APP_DB_POOL_SIZE", "4"))
+
+
+class SQLitePool:
+    """Fixed set of pre-opened connections handed out one per request."""
+
+    def __init__(self, db_path: str | None = None, size: int | None = None):
+        self.path = db_path or get_db_path()
+        self.size = size or get_pool_size()
+        self._idle: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        for _ in range(self.size):
+            self._idle.put(open_connection(self.path))
+
+    def acquire(self) -> sqlite3.Connection:
+        # Never block: acquire() runs on the event loop, so an exhausted pool
+        # opens an overflow connection instead of waiting.
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return open_connection(self.path)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        if self._idle.qsize() >= self.size:
+            conn.close()
+            return
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class DBMiddleware:
+    """Bind a pooled connection to each HTTP request (see ``app.db.get_request_conn``)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(_SKIP_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        pool: SQLitePool = scope["app"].state.pool
+        conn = pool.acquire()
+        state = scope.setdefault("state", {})
+        # request.state.conn is kept as an alias for code that reads it directly.
+        state["conn"] = conn
+        state["user"] = None
+        token = bind_request_conn(conn)
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                pool.release(conn)
+
+        async def send_and_release(message: Message) -> None:
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                release()
+
+        try:
+            await self.app(scope, receive, send_and_release)
+        finally:
+            unbind_request_conn(token)
+            release()
@@ -5,13 +5,25 @@ from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, Form, HTTPException, Request
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from starlette.middleware.sessions import SessionMiddleware
-
-from app.auth import ROLE_ADMIN, ROLE_CHILD, ROLE_PARENT
-from app.db import connect, init_db
+from jinja2 import FileSystemBytecodeCache
+
+from app.auth import ADMIN_ONLY, CHILD_ONLY, PARENT_OR_ADMIN, ROLE_ADMIN, ROLE_CHILD, ROLE_PARENT
+from app.db import get_request_conn, init_db
+from app.db_pool import DBMiddleware, SQLitePool
+from app.schemas import (
+    ChoreCreateIn,
+    LoginIn,
+    NoteIn,
+    PasswordResetIn,
+    RewardCreateIn,
+    UserCreateIn,
+    UserPatchIn,
+)
 from app.services.core import (
     AppError,
     approvals_queue,
@@ -19,55 +31,85 @@ from app.services.core import (
     approve_redemption,
     authenticate,
     change_password,
+    count_chores,
     create_chore,
     create_reward,
     create_user,
+    dashboard_parent_bundle,
     deny_redemption,
     get_chore,
     get_points_total,
     get_user,
     list_chores,
+    list_chores_json,
     list_ledger,
-    list_redemptions,
+    list_redemptions_json,
     list_rewards,
     list_users,
+    list_users_json,
     mark_chore_done,
     patch_user,
     reject_chore,
     request_redemption,
     reset_password,
+    rewards_page_bundle,
 )
+from app.session import UserIdSessionMiddleware
+from app.static_cache import StaticCacheMiddleware, asset_version
 
 APP_PORT = int(os.getenv("APP_PORT", "8080"))
 APP_SECRET = os.getenv("APP_SECRET", "dev-secret-change-me")
 FRONTEND_DIST = Path(__file__).resolve().parents[1] / "frontend" / "dist"
 FRONTEND_INDEX = FRONTEND_DIST / "index.html"
+TEMPLATE_CACHE_DIR = os.getenv("APP_TEMPLATE_CACHE_DIR", ".jinja_cache")
+
+_AUTH_REQUIRED = "Authentication required"
+_FORBIDDEN = "Insufficient permissions"
 
-app = FastAPI(title="Healthy Routine for Kids")
-app.add_middleware(SessionMiddleware, secret_key=APP_SECRET, same_site="lax")
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+app = FastAPI(title="Healthy Routine for Kids", default_response_class=ORJSONResponse)
+app.add_middleware(UserIdSessionMiddleware, secret_key=APP_SECRET, same_site="lax")
+app.add_middleware(DBMiddleware)
+app.add_middleware(StaticCacheMiddleware)
+app.mount("/static", StaticFiles(directory="app/static", html=False), name="static")
 templates = Jinja2Templates(directory="app/templates")
+templates.env.globals["static_version"] = asset_version("app/static")
 if (FRONTEND_DIST / "assets").exists():
     app.mount("/ui/assets", StaticFiles(directory=str(FRONTEND_DIST / "assets")), name="ui-assets")
 
 
+def _preload_templates() -> None:
+    # Compile every template up front (and persist bytecode across restarts)
+    # so the first request to each page doesn't pay the parse/compile cost.
+    # The cache is optional: an uncreatable or read-only directory just means no bytecode cache.
+    try:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    except OSError:
+        pass
+    if os.access(TEMPLATE_CACHE_DIR, os.W_OK | os.X_OK):
+        templates.env.bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+    names = templates.env.list_templates(extensions=["html"])
+    try:
+        for name in names:
+            templates.env.get_template(name)
+    except OSError:
+        # os.access can't see read-only mounts (or root); fall back to compiling in memory.
+        templates.env.bytecode_cache = None
+        for name in names:
+            templates.env.get_template(name)
+
+
 @app.on_event("startup")
 def startup() -> None:
     init_db()
+    app.state.pool = SQLitePool()
+    _preload_templates()
     if APP_SECRET == "dev-secret-change-me":
         print("WARNING: APP_SECRET is default. Set APP_SECRET in production.")
 
 
-@app.middleware("http")
-async def attach_user(request: Request, call_next):
-    conn = connect()
-    request.state.conn = conn
-    request.state.user = None
-    try:
-        response = await call_next(request)
-    finally:
-        conn.close()
-    return response
+@app.on_event("shutdown")
+def shutdown() -> None:
+    app.state.pool.close()
 
 
 def _current_user(request: Request):
@@ -78,7 +120,7 @@ def _current_user(request: Request):
     user_id = request.session.get("user_id")
     if not user_id:
         return None
-    user = get_user(request.state.conn, int(user_id))
+    user = get_user(get_request_conn(), int(user_id))
     if not user or not user["is_active"]:
         request.session.clear()
         return None
@@ -87,63 +129,60 @@ def _current_user(request: Request):
 
 
 def _require_login(request: Request):
-    user = _current_user(request)
+    user = request.state.user or _current_user(request)
     if not user:
-        raise HTTPException(status_code=401, detail="Authentication required")
+        raise HTTPException(status_code=401, detail=_AUTH_REQUIRED)
     return user
 
 
-def _ctx(request: Request, **kwargs: Any) -> dict[str, Any]:
-    user = _current_user(request)
-    return {
-        "request": request,
-        "user": user,
-        "is_admin": bool(user and user["role"] == ROLE_ADMIN),
-        "is_parent": bool(user and user["role"] == ROLE_PARENT),
-        "is_child": bool(user and user["role"] == ROLE_CHILD),
-        **kwargs,
-    }
+_PUBLIC_USER_FIELDS = ("id", "username", "display_name", "role", "avatar", "must_change_password")
 
 
-async def _body(request: Request) -> dict[str, Any]:
-    ct = request.headers.get("content-type", "")
-    if "application/json" in ct:
-        return await request.json()
-    form = await request.form()
-    return dict(form)
+def _public_user(user: dict[str, Any]) -> dict[str, Any]:
+    return {k: user[k] for k in _PUBLIC_USER_FIELDS}
 
 
-def _error_response(request: Request, e: AppError):
-    if request.url.path.startswith("/api/"):
-        return JSONResponse(status_code=e.status_code, content={"error": e.message})
-    raise HTTPException(status_code=e.status_code, detail=e.message)
+def _json_response(body: str) -> Response:
+    # Body was already serialized by SQLite (see the *_json list services).
+    return Response(content=body, media_type="application/json")
 
 
-def _parse_int(value: Any, field_name: str) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        raise AppError(f"{field_name} must be an integer", 400)
+def _ctx(request: Request, **kwargs: Any) -> dict[str, Any]:
+    base = getattr(request.state, "base_ctx", None)
+    if base is None:
+        user = _current_user(request)
+        role = user["role"] if user else None
+        base = {
+            "request": request,
+            "user": user,
+            "is_admin": role == ROLE_ADMIN,
+            "is_parent": role == ROLE_PARENT,
+            "is_child": role == ROLE_CHILD,
+        }
+        request.state.base_ctx = base
+    return {**base, **kwargs}
 
 
-def _parse_int_list(values: Any, field_name: str) -> list[int]:
-    if isinstance(values, str):
-        raw_items = [v for v in values.split(",") if v.strip()]
-    elif isinstance(values, list):
-        raw_items = values
-    else:
-        raise AppError(f"{field_name} must be a list of integers", 400)
+def _error_response(request: Request, e: AppError):
+    if request.url.path.startswith("/api/"):
+        return ORJSONResponse(status_code=e.status_code, content={"error": e.message})
+    raise HTTPException(status_code=e.status_code, detail=e.message)
+
 
-    out: list[int] = []
-    for v in raw_items:
-        out.append(_parse_int(v, field_name))
-    return out
+@app.exception_handler(RequestValidationError)
+async def _validation_error(request: Request, exc: RequestValidationError):
+    # Keep the API's {"error": ...} shape for malformed bodies.
+    if not request.url.path.startswith("/api/"):
+        return await request_validation_exception_handler(request, exc)
+    err = exc.errors()[0]
+    field = ".".join(str(p) for p in err["loc"][1:]) or "body"
+    return ORJSONResponse(status_code=400, content={"error": f"{field}: {err['msg']}"})
 
 
-def _require_roles(request: Request, roles: set[str]):
+def _require_roles(request: Request, roles: frozenset[str]):
     user = _require_login(request)
     if user["role"] not in roles:
-        raise HTTPException(status_code=403, detail="Insufficient permissions")
+        raise HTTPException(status_code=403, detail=_FORBIDDEN)
     return user
 
 
@@ -187,8 +226,8 @@ def login_page(request: Request, error: str | None = None):
 
 
 @app.post("/login")
-async def login_submit(request: Request, username: str = Form(...), password: str = Form(...)):
-    conn = request.state.conn
+def login_submit(request: Request, username: str = Form(...), password: str = Form(...)):
+    conn = get_request_conn()
     try:
         user = authenticate(conn, username, password)
     except AppError:
@@ -206,39 +245,33 @@ def logout_submit(request: Request):
 @app.get("/dashboard")
 def dashboard(request: Request):
     user = _require_login(request)
-    conn = request.state.conn
+    conn = get_request_conn()
 
     if user["role"] == ROLE_CHILD:
-        chores = list_chores(conn, user)
+        chores = list_chores(conn, user, limit=8)
+        pending_count = count_chores(conn, user, status="DONE_PENDING")
         points = get_points_total(conn, user["id"])
-        rewards = [r for r in list_rewards(conn) if r["is_active"]]
-        pending = [c for c in chores if c["status"] == "DONE_PENDING"]
+        rewards = list_rewards(conn, active_only=True, limit=6)
         return templates.TemplateResponse(
             "dashboard_child.html",
-            _ctx(request, chores=chores[:8], pending_count=len(pending), points=points, rewards=rewards[:6]),
+            _ctx(request, chores=chores, pending_count=pending_count, points=points, rewards=rewards),
         )
 
-    if user["role"] in {ROLE_PARENT, ROLE_ADMIN}:
-        children = [u for u in list_users(conn) if u["role"] == ROLE_CHILD and u["is_active"]]
-        child_points = [{"user": c, "points": get_points_total(conn, c["id"])} for c in children]
-        pending = approvals_queue(conn)
+    if user["role"] in PARENT_OR_ADMIN:
         template = "dashboard_parent.html" if user["role"] == ROLE_PARENT else "dashboard_admin.html"
-        return templates.TemplateResponse(
-            template,
-            _ctx(request, child_points=child_points, pending=pending),
-        )
+        return templates.TemplateResponse(template, _ctx(request, **dashboard_parent_bundle(conn)))
 
     raise HTTPException(status_code=403, detail="Unknown role")
 
 
 @app.post("/me/change-password")
-async def web_change_password(
+def web_change_password(
     request: Request,
     old_password: str = Form(...),
     new_password: str = Form(...),
 ):
     user = _require_login(request)
-    conn = request.state.conn
+    conn = get_request_conn()
     try:
         change_password(conn, user["id"], old_password, new_password)
     except AppError as e:
@@ -248,13 +281,13 @@ async def web_change_password(
 
 @app.get("/users")
 def users_page(request: Request):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     return templates.TemplateResponse("users.html", _ctx(request, users=list_users(conn)))
 
 
 @app.post("/users/create")
-async def users_create(
+def users_create(
     request: Request,
     username: str = Form(...),
     display_name: str = Form(...),
@@ -262,8 +295,8 @@ async def users_create(
     password: str = Form(...),
     avatar: str = Form("🙂"),
 ):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     try:
         create_user(conn, username, display_name, role, password, avatar)
     except AppError as e:
@@ -272,9 +305,9 @@ async def users_create(
 
 
 @app.post("/users/{user_id}/toggle")
-async def users_toggle(request: Request, user_id: int):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
+def users_toggle(request: Request, user_id: int):
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     user = get_user(conn, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -283,9 +316,9 @@ async def users_toggle(request: Request, user_id: int):
 
 
 @app.post("/users/{user_id}/role")
-async def users_role(request: Request, user_id: int, role: str = Form(...)):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
+def users_role(request: Request, user_id: int, role: str = Form(...)):
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     try:
         patch_user(conn, user_id, {"role": role})
     except AppError as e:
@@ -294,9 +327,9 @@ async def users_role(request: Request, user_id: int, role: str = Form(...)):
 
 
 @app.post("/users/{user_id}/reset-password")
-async def users_reset_password(request: Request, user_id: int, new_password: str = Form(...)):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
+def users_reset_password(request: Request, user_id: int, new_password: str = Form(...)):
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     try:
         reset_password(conn, user_id, new_password)
     except AppError as e:
@@ -307,14 +340,14 @@ async def users_reset_password(request: Request, user_id: int, new_password: str
 @app.get("/chores")
 def chores_page(request: Request, status: str | None = None):
     user = _require_login(request)
-    conn = request.state.conn
+    conn = get_request_conn()
     chores = list_chores(conn, user, status=status)
-    children = [u for u in list_users(conn) if u["role"] == ROLE_CHILD and u["is_active"]]
+    children = list_users(conn, role=ROLE_CHILD, is_active=1)
     return templates.TemplateResponse("chores.html", _ctx(request, chores=chores, children=children, status_filter=status))
 
 
 @app.post("/chores/create")
-async def chores_create(
+def chores_create(
     request: Request,
     title: str = Form(...),
     description: str = Form(""),
@@ -323,8 +356,8 @@ async def chores_create(
     recurrence: str = Form("NONE"),
     due_date: str = Form(""),
 ):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
         create_chore(
             conn,
@@ -344,17 +377,18 @@ async def chores_create(
 @app.get("/chores/{chore_id}")
 def chore_detail_page(request: Request, chore_id: int):
     user = _require_login(request)
-    conn = request.state.conn
-    chore = get_chore(conn, chore_id)
-    if user["role"] == ROLE_CHILD and user["id"] not in [a["id"] for a in chore["assignees"]]:
+    conn = get_request_conn()
+    is_child = user["role"] == ROLE_CHILD
+    chore = get_chore(conn, chore_id, viewer_id=user["id"] if is_child else None)
+    if is_child and not chore.pop("is_assignee"):
         raise HTTPException(status_code=403, detail="Not allowed")
     return templates.TemplateResponse("chore_detail.html", _ctx(request, chore=chore))
 
 
 @app.post("/chores/{chore_id}/done")
 def chores_done_web(request: Request, chore_id: int):
-    user = _require_roles(request, {ROLE_CHILD})
-    conn = request.state.conn
+    user = _require_roles(request, CHILD_ONLY)
+    conn = get_request_conn()
     try:
         mark_chore_done(conn, user, chore_id)
     except AppError as e:
@@ -364,15 +398,15 @@ def chores_done_web(request: Request, chore_id: int):
 
 @app.get("/approvals")
 def approvals_page(request: Request):
-    _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
+    _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     return templates.TemplateResponse("approvals.html", _ctx(request, queue=approvals_queue(conn)))
 
 
 @app.post("/chores/{chore_id}/approve")
-async def chores_approve_web(request: Request, chore_id: int, note: str = Form("")):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
+def chores_approve_web(request: Request, chore_id: int, note: str = Form("")):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
         approve_chore(conn, user, chore_id, note)
     except AppError as e:
@@ -381,9 +415,9 @@ async def chores_approve_web(request: Request, chore_id: int, note: str = Form("
 
 
 @app.post("/chores/{chore_id}/reject")
-async def chores_reject_web(request: Request, chore_id: int, note: str = Form("")):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
+def chores_reject_web(request: Request, chore_id: int, note: str = Form("")):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
         reject_chore(conn, user, chore_id, note)
     except AppError as e:
@@ -394,23 +428,20 @@ async def chores_reject_web(request: Request, chore_id: int, note: str = Form(""
 @app.get("/rewards")
 def rewards_page(request: Request):
     user = _require_login(request)
-    conn = request.state.conn
-    return templates.TemplateResponse(
-        "rewards.html",
-        _ctx(request, rewards=list_rewards(conn), redemptions=list_redemptions(conn, user), points=get_points_total(conn, user["id"])),
-    )
+    conn = get_request_conn()
+    return templates.TemplateResponse("rewards.html", _ctx(request, **rewards_page_bundle(conn, user)))
 
 
 @app.post("/rewards/create")
-async def rewards_create_web(
+def rewards_create_web(
     request: Request,
     name: str = Form(...),
     cost: int = Form(...),
     is_active: str = Form("1"),
     limit_per_week: str = Form(""),
 ):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
         create_reward(conn, user, name, cost, is_active == "1", int(limit_per_week) if limit_per_week else None)
     except AppError as e:
@@ -420,8 +451,8 @@ async def rewards_create_web(
 
 @app.post("/rewards/{reward_id}/redeem")
 def rewards_redeem_web(request: Request, reward_id: int):
-    user = _require_roles(request, {ROLE_CHILD})
-    conn = request.state.conn
+    user = _require_roles(request, CHILD_ONLY)
+    conn = get_request_conn()
     try:
         request_redemption(conn, user, reward_id)
     except AppError as e:
@@ -430,9 +461,9 @@ def rewards_redeem_web(request: Request, reward_id: int):
 
 
 @app.post("/redemptions/{redemption_id}/approve")
-async def redemptions_approve_web(request: Request, redemption_id: int, note: str = Form("")):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
+def redemptions_approve_web(request: Request, redemption_id: int, note: str = Form("")):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
         approve_redemption(conn, user, redemption_id, note)
     except AppError as e:
@@ -441,9 +472,9 @@ async def redemptions_approve_web(request: Request, redemption_id: int, note: st
 
 
 @app.post("/redemptions/{redemption_id}/deny")
-async def redemptions_deny_web(request: Request, redemption_id: int, note: str = Form("")):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
+def redemptions_deny_web(request: Request, redemption_id: int, note: str = Form("")):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
         deny_redemption(conn, user, redemption_id, note)
     except AppError as e:
@@ -454,7 +485,7 @@ async def redemptions_deny_web(request: Request, redemption_id: int, note: str =
 @app.get("/ledger")
 def ledger_page(request: Request, user_id: int | None = None):
     actor = _require_login(request)
-    conn = request.state.conn
+    conn = get_request_conn()
 
     if actor["role"] == ROLE_CHILD:
         target_user_id = actor["id"]
@@ -464,7 +495,7 @@ def ledger_page(request: Request, user_id: int | None = None):
     if actor["role"] == ROLE_CHILD and target_user_id != actor["id"]:
         raise HTTPException(status_code=403, detail="Not allowed")
 
-    child_users = [u for u in list_users(conn) if u["role"] == ROLE_CHILD and u["is_active"]]
+    child_users = list_users(conn, role=ROLE_CHILD, is_active=1)
     entries = list_ledger(conn, target_user_id)
     total = get_points_total(conn, target_user_id)
     return templates.TemplateResponse(
@@ -477,21 +508,14 @@ def ledger_page(request: Request, user_id: int | None = None):
 
 
 @app.post("/api/login")
-async def api_login(request: Request):
-    conn = request.state.conn
-    data = await _body(request)
+def api_login(request: Request, body: LoginIn):
+    conn = get_request_conn()
     try:
-        user = authenticate(conn, data.get("username", ""), data.get("password", ""))
+        user = authenticate(conn, body.username, body.password)
     except AppError as e:
         return _error_response(request, e)
     request.session["user_id"] = user["id"]
-    return {
-        "id": user["id"],
-        "username": user["username"],
-        "display_name": user["display_name"],
-        "role": user["role"],
-        "must_change_password": user["must_change_password"],
-    }
+    return _public_user(user)
 
 
 @app.post("/api/logout")
@@ -503,68 +527,51 @@ def api_logout(request: Request):
 @app.get("/api/me")
 def api_me(request: Request):
     user = _require_login(request)
-    return {
-        "id": user["id"],
-        "username": user["username"],
-        "display_name": user["display_name"],
-        "role": user["role"],
-        "avatar": user["avatar"],
-        "must_change_password": user["must_change_password"],
-    }
+    return _public_user(user)
 
 
 @app.get("/api/users")
 def api_users_list(request: Request):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
-    return list_users(conn)
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
+    return _json_response(list_users_json(conn))
 
 
 @app.get("/api/children")
 def api_children_list(request: Request):
-    _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
-    return [u for u in list_users(conn) if u["role"] == ROLE_CHILD and u["is_active"]]
+    _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
+    return _json_response(list_users_json(conn, role=ROLE_CHILD, is_active=1))
 
 
 @app.post("/api/users", status_code=201)
-async def api_users_create(request: Request):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_users_create(request: Request, body: UserCreateIn):
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     try:
-        user = create_user(
-            conn,
-            data.get("username", ""),
-            data.get("display_name", ""),
-            data.get("role", ""),
-            data.get("password", ""),
-            data.get("avatar", "🙂"),
-        )
+        user = create_user(conn, body.username, body.display_name, body.role, body.password, body.avatar)
     except AppError as e:
         return _error_response(request, e)
     return user
 
 
 @app.patch("/api/users/{user_id}")
-async def api_users_patch(request: Request, user_id: int):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_users_patch(request: Request, user_id: int, body: UserPatchIn):
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     try:
-        user = patch_user(conn, user_id, data)
+        user = patch_user(conn, user_id, body.model_dump(exclude_unset=True))
     except AppError as e:
         return _error_response(request, e)
     return user
 
 
 @app.post("/api/users/{user_id}/reset-password")
-async def api_users_reset_password(request: Request, user_id: int):
-    _require_roles(request, {ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_users_reset_password(request: Request, user_id: int, body: PasswordResetIn):
+    _require_roles(request, ADMIN_ONLY)
+    conn = get_request_conn()
     try:
-        reset_password(conn, user_id, data.get("new_password", ""))
+        reset_password(conn, user_id, body.new_password)
     except AppError as e:
         return _error_response(request, e)
     return {"ok": True}
@@ -573,26 +580,24 @@ async def api_users_reset_password(request: Request, user_id: int):
 @app.get("/api/chores")
 def api_chores_list(request: Request, status: str | None = None):
     user = _require_login(request)
-    conn = request.state.conn
-    return list_chores(conn, user, status=status)
+    conn = get_request_conn()
+    return _json_response(list_chores_json(conn, user, status=status))
 
 
 @app.post("/api/chores", status_code=201)
-async def api_chores_create(request: Request):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_chores_create(request: Request, body: ChoreCreateIn):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
-        assignee_ids = _parse_int_list(data.get("assignee_ids", []), "assignee_ids")
         chore = create_chore(
             conn,
             user,
-            data.get("title", ""),
-            data.get("description", ""),
-            _parse_int(data.get("points", 0), "points"),
-            assignee_ids,
-            data.get("recurrence", "NONE"),
-            data.get("due_date") or None,
+            body.title,
+            body.description,
+            body.points,
+            body.assignee_ids,
+            body.recurrence,
+            body.due_date or None,
         )
     except AppError as e:
         return _error_response(request, e)
@@ -602,20 +607,21 @@ async def api_chores_create(request: Request):
 @app.get("/api/chores/{chore_id}")
 def api_chores_get(request: Request, chore_id: int):
     user = _require_login(request)
-    conn = request.state.conn
+    conn = get_request_conn()
+    is_child = user["role"] == ROLE_CHILD
     try:
-        chore = get_chore(conn, chore_id)
+        chore = get_chore(conn, chore_id, viewer_id=user["id"] if is_child else None)
     except AppError as e:
         return _error_response(request, e)
-    if user["role"] == ROLE_CHILD and user["id"] not in [a["id"] for a in chore["assignees"]]:
+    if is_child and not chore.pop("is_assignee"):
         raise HTTPException(status_code=403, detail="Not allowed")
     return chore
 
 
 @app.post("/api/chores/{chore_id}/done")
 def api_chores_done(request: Request, chore_id: int):
-    user = _require_roles(request, {ROLE_CHILD})
-    conn = request.state.conn
+    user = _require_roles(request, CHILD_ONLY)
+    conn = get_request_conn()
     try:
         chore = mark_chore_done(conn, user, chore_id)
     except AppError as e:
@@ -624,24 +630,22 @@ def api_chores_done(request: Request, chore_id: int):
 
 
 @app.post("/api/chores/{chore_id}/approve")
-async def api_chores_approve(request: Request, chore_id: int):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_chores_approve(request: Request, chore_id: int, body: NoteIn | None = None):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
-        chore = approve_chore(conn, user, chore_id, data.get("note"))
+        chore = approve_chore(conn, user, chore_id, body.note if body else None)
     except AppError as e:
         return _error_response(request, e)
     return chore
 
 
 @app.post("/api/chores/{chore_id}/reject")
-async def api_chores_reject(request: Request, chore_id: int):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_chores_reject(request: Request, chore_id: int, body: NoteIn | None = None):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
-        chore = reject_chore(conn, user, chore_id, data.get("note"))
+        chore = reject_chore(conn, user, chore_id, body.note if body else None)
     except AppError as e:
         return _error_response(request, e)
     return chore
@@ -650,28 +654,16 @@ async def api_chores_reject(request: Request, chore_id: int):
 @app.get("/api/rewards")
 def api_rewards_list(request: Request):
     _require_login(request)
-    conn = request.state.conn
+    conn = get_request_conn()
     return list_rewards(conn)
 
 
 @app.post("/api/rewards", status_code=201)
-async def api_rewards_create(request: Request):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_rewards_create(request: Request, body: RewardCreateIn):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
-        raw_active = data.get("is_active", True)
-        is_active = raw_active if isinstance(raw_active, bool) else str(raw_active).lower() in {"1", "true", "yes", "on"}
-        reward = create_reward(
-            conn,
-            user,
-            data.get("name", ""),
-            _parse_int(data.get("cost", 0), "cost"),
-            is_active,
-            _parse_int(data["limit_per_week"], "limit_per_week")
-            if data.get("limit_per_week") not in (None, "")
-            else None,
-        )
+        reward = create_reward(conn, user, body.name, body.cost, body.is_active, body.limit_per_week)
     except AppError as e:
         return _error_response(request, e)
     return reward
@@ -679,8 +671,8 @@ async def api_rewards_create(request: Request):
 
 @app.post("/api/rewards/{reward_id}/redeem")
 def api_rewards_redeem(request: Request, reward_id: int):
-    user = _require_roles(request, {ROLE_CHILD})
-    conn = request.state.conn
+    user = _require_roles(request, CHILD_ONLY)
+    conn = get_request_conn()
     try:
         redemption = request_redemption(conn, user, reward_id)
     except AppError as e:
@@ -691,29 +683,27 @@ def api_rewards_redeem(request: Request, reward_id: int):
 @app.get("/api/redemptions")
 def api_redemptions_list(request: Request):
     user = _require_login(request)
-    conn = request.state.conn
-    return list_redemptions(conn, user)
+    conn = get_request_conn()
+    return _json_response(list_redemptions_json(conn, user))
 
 
 @app.post("/api/redemptions/{redemption_id}/approve")
-async def api_redemptions_approve(request: Request, redemption_id: int):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_redemptions_approve(request: Request, redemption_id: int, body: NoteIn | None = None):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
-        redemption = approve_redemption(conn, user, redemption_id, data.get("note"))
+        redemption = approve_redemption(conn, user, redemption_id, body.note if body else None)
     except AppError as e:
         return _error_response(request, e)
     return redemption
 
 
 @app.post("/api/redemptions/{redemption_id}/deny")
-async def api_redemptions_deny(request: Request, redemption_id: int):
-    user = _require_roles(request, {ROLE_PARENT, ROLE_ADMIN})
-    conn = request.state.conn
-    data = await _body(request)
+def api_redemptions_deny(request: Request, redemption_id: int, body: NoteIn | None = None):
+    user = _require_roles(request, PARENT_OR_ADMIN)
+    conn = get_request_conn()
     try:
-        redemption = deny_redemption(conn, user, redemption_id, data.get("note"))
+        redemption = deny_redemption(conn, user, redemption_id, body.note if body else None)
     except AppError as e:
         return _error_response(request, e)
     return redemption
@@ -722,17 +712,18 @@ async def api_redemptions_deny(request: Request, redemption_id: int):
 @app.get("/api/ledger")
 def api_ledger(request: Request, user_id: int | None = None):
     actor = _require_login(request)
-    conn = request.state.conn
+    conn = get_request_conn()
     target_user_id = user_id or actor["id"]
 
     if actor["role"] == ROLE_CHILD and target_user_id != actor["id"]:
         raise HTTPException(status_code=403, detail="Not allowed")
 
-    if actor["role"] in {ROLE_PARENT, ROLE_ADMIN}:
+    if actor["role"] in PARENT_OR_ADMIN:
         # Parent/Admin UI may request ledger before selecting a child.
         # Fall back to first active child to avoid a hard 400 on initial load.
         if user_id is None:
-            child = next((u for u in list_users(conn) if u["role"] == ROLE_CHILD and u["is_active"]), None)
+            children = list_users(conn, role=ROLE_CHILD, is_active=1)
+            child = children[0] if children else None
             if child:
                 target_user_id = child["id"]
             else:
@@ -744,7 +735,7 @@ def api_ledger(request: Request, user_id: int | None = None):
     return {
         "user_id": target_user_id,
         "total": get_points_total(conn, target_user_id),
-        "entries": list_ledger(conn, target_user_id),
+        "entries": list(list_ledger(conn, target_user_id)),
     }
 
 
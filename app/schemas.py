@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, field_validator
+
+# Request bodies for the JSON API. Fields default to empty values so missing
+# input still reaches the service layer and gets its usual AppError message.
+
+
+class LoginIn(BaseModel):
+    username: str = ""
+    password: str = ""
+
+
+class UserCreateIn(BaseModel):
+    username: str = ""
+    display_name: str = ""
+    role: str = ""
+    password: str = ""
+    avatar: str = "🙂"
+
+
+class UserPatchIn(BaseModel):
+    display_name: str | None = None
+    role: str | None = None
+    avatar: str | None = None
+    is_active: bool | None = None
+    must_change_password: bool | None = None
+
+
+class PasswordResetIn(BaseModel):
+    new_password: str = ""
+
+
+class ChoreCreateIn(BaseModel):
+    title: str = ""
+    description: str | None = ""
+    points: int = 0
+    assignee_ids: list[int] = []
+    recurrence: str = "NONE"
+    due_date: str | None = None
+
+    @field_validator("assignee_ids", mode="before")
+    @classmethod
+    def _split_csv(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [v for v in value.split(",") if v.strip()]
+        return value
+
+
+class RewardCreateIn(BaseModel):
+    name: str = ""
+    cost: int = 0
+    is_active: bool = True
+    limit_per_week: int | None = None
+
+    @field_validator("limit_per_week", mode="before")
+    @classmethod
+    def _blank_is_none(cls, value: Any) -> Any:
+        return None if value == "" else value
+
+
+class NoteIn(BaseModel):
+    note: str | None = None
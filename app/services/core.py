@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import json
 import sqlite3
-from datetime import datetime, timedelta, timezone
+import time
+from collections.abc import Iterator
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Any
 
-from app.auth import ROLE_ADMIN, ROLE_CHILD, ROLE_PARENT, hash_password, verify_password
-from app.db import now_iso
+from app.auth import (
+    ALL_ROLES,
+    PARENT_OR_ADMIN,
+    ROLE_CHILD,
+    hash_password,
+    verify_and_update_password,
+    verify_password,
+)
+from app.db import HAS_AGGREGATE_ORDER_BY, HAS_RETURNING, now_iso, read_snapshot, txn
+
+
+_RECURRENCES = frozenset({"NONE", "DAILY", "WEEKLY"})
+_REPEATING = frozenset({"DAILY", "WEEKLY"})
+# A child may (re)submit a chore from these statuses.
+_MARKABLE_STATUSES = frozenset({"ASSIGNED", "REJECTED"})
+_PATCHABLE_USER_FIELDS = frozenset({"display_name", "role", "avatar", "is_active", "must_change_password"})
 
 
 class AppError(Exception):
@@ -15,35 +33,135 @@ class AppError(Exception):
         self.status_code = status_code
 
 
+# Explicit projections: only the columns callers use are decoded, and
+# password_hash never leaves this module unless asked for.
+_USER_FIELDS = ("id", "username", "display_name", "role", "avatar", "is_active", "must_change_password", "created_at")
+_USER_COLUMNS = ", ".join(_USER_FIELDS)
+_CHORE_FIELDS = ("id", "title", "description", "points", "recurrence", "due_date", "status", "created_by", "created_at")
+_CHORE_COLUMNS = ", ".join(_CHORE_FIELDS)
+_CHORE_COLUMNS_C = ", ".join(f"c.{f}" for f in _CHORE_FIELDS)
+_REWARD_COLUMNS = "id, name, cost, is_active, limit_per_week, created_by, created_at"
+_REDEMPTION_COLUMNS = "id, reward_id, user_id, status, note, created_at, updated_at, handled_by"
+_REDEMPTION_FIELDS = (
+    "id", "reward_id", "user_id", "status", "note", "created_at", "updated_at", "handled_by",
+    "reward_name", "reward_cost", "user_name",
+)
+_REDEMPTION_COLUMNS_R = (
+    "r.id, r.reward_id, r.user_id, r.status, r.note, r.created_at, r.updated_at, r.handled_by, "
+    "rw.name AS reward_name, rw.cost AS reward_cost, u.display_name AS user_name"
+)
+
+# Hot-path statements. sqlite3 keeps each connection's prepared statements in an
+# LRU keyed by SQL text (cached_statements in app.db), so sharing one constant
+# per query keeps every call site on the same compiled statement.
+_SQL_GET_USER = f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?"
+_SQL_GET_USER_WITH_SECRET = f"SELECT {_USER_COLUMNS}, password_hash FROM users WHERE id = ?"
+_SQL_GET_USER_BY_USERNAME = f"SELECT {_USER_COLUMNS} FROM users WHERE username = ?"
+_SQL_GET_USER_BY_USERNAME_WITH_SECRET = f"SELECT {_USER_COLUMNS}, password_hash FROM users WHERE username = ?"
+_SQL_CHORE_ASSIGNEE_IDS = "SELECT user_id FROM chore_assignments WHERE chore_id = ?"
+_SQL_POINTS_TOTAL = "SELECT COALESCE(SUM(delta), 0) AS total FROM ledger WHERE user_id = ?"
+_SQL_INSERT_LEDGER = "INSERT INTO ledger (user_id, delta, reason, ref_type, ref_id, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+_SQL_LIST_LEDGER = (
+    "SELECT id, user_id, delta, reason, ref_type, ref_id, created_at FROM ledger WHERE user_id = ? ORDER BY id DESC"
+)
+
+
 def row_to_dict(row: sqlite3.Row | None) -> dict[str, Any] | None:
     if row is None:
         return None
     return {k: row[k] for k in row.keys()}
 
 
-def list_users(conn: sqlite3.Connection) -> list[dict[str, Any]]:
-    rows = conn.execute(
-        "SELECT id, username, display_name, role, avatar, is_active, must_change_password, created_at FROM users ORDER BY id"
-    ).fetchall()
-    return [row_to_dict(r) for r in rows]
+def _insert_returning(conn: sqlite3.Connection, table: str, columns: str, sql: str, params: Any) -> dict[str, Any]:
+    """Run a single-row INSERT into ``table`` and return ``columns`` of the stored row."""
+    if HAS_RETURNING:
+        # fetchall() steps the statement to completion so it never lingers open.
+        return row_to_dict(conn.execute(f"{sql} RETURNING {columns}", params).fetchall()[0])
+    cur = conn.execute(sql, params)
+    return row_to_dict(conn.execute(f"SELECT {columns} FROM {table} WHERE id = ?", (cur.lastrowid,)).fetchone())
 
 
-def get_user(conn: sqlite3.Connection, user_id: int) -> dict[str, Any] | None:
-    row = conn.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+def _fetchall_dicts(conn: sqlite3.Connection, sql: str, params: Any = ()) -> list[dict[str, Any]]:
+    # Column names are read once per result set instead of once per row, and the
+    # cursor yields plain tuples so no sqlite3.Row is allocated per row.
+    cur = conn.execute(sql, params)
+    cur.row_factory = None
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, r)) for r in cur.fetchall()]
+
+
+def _fetch_json_array(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: Any,
+    fields: tuple[str, ...],
+    order_by: str,
+    json_fields: tuple[str, ...] = (),
+) -> str:
+    # SQLite serializes each row, so API list endpoints can send the text as-is
+    # instead of building dicts for the JSON encoder. The rows are joined here
+    # rather than with json_group_array: an aggregate does not promise to keep a
+    # subquery's order, while the outer ORDER BY does. ``json_fields`` are
+    # columns already holding JSON text that must be embedded, not quoted.
+    pairs = ", ".join(f"'{f}', json({f})" if f in json_fields else f"'{f}', {f}" for f in fields)
+    cur = conn.execute(f"SELECT json_object({pairs}) FROM ({sql}) ORDER BY {order_by}", params)
+    cur.row_factory = None
+    return "[" + ",".join(r[0] for r in cur) + "]"
+
+
+def _user_filters(role: str | None, is_active: int | None) -> tuple[str, list[Any]]:
+    params: list[Any] = []
+    where = ["1=1"]
+    if role is not None:
+        where.append("role = ?")
+        params.append(role)
+    if is_active is not None:
+        where.append("is_active = ?")
+        params.append(is_active)
+    return " AND ".join(where), params
+
+
+def list_users(
+    conn: sqlite3.Connection,
+    role: str | None = None,
+    is_active: int | None = None,
+) -> list[dict[str, Any]]:
+    where, params = _user_filters(role, is_active)
+    return _fetchall_dicts(conn, f"SELECT {_USER_COLUMNS} FROM users WHERE {where} ORDER BY id", params)
+
+
+def list_users_json(
+    conn: sqlite3.Connection,
+    role: str | None = None,
+    is_active: int | None = None,
+) -> str:
+    where, params = _user_filters(role, is_active)
+    return _fetch_json_array(
+        conn, f"SELECT {_USER_COLUMNS} FROM users WHERE {where}", params, _USER_FIELDS, order_by="id"
+    )
+
+
+def get_user(conn: sqlite3.Connection, user_id: int, include_secret: bool = False) -> dict[str, Any] | None:
+    row = conn.execute(_SQL_GET_USER_WITH_SECRET if include_secret else _SQL_GET_USER, (user_id,)).fetchone()
     return row_to_dict(row)
 
 
-def get_user_by_username(conn: sqlite3.Connection, username: str) -> dict[str, Any] | None:
-    row = conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
+def get_user_by_username(conn: sqlite3.Connection, username: str, include_secret: bool = False) -> dict[str, Any] | None:
+    sql = _SQL_GET_USER_BY_USERNAME_WITH_SECRET if include_secret else _SQL_GET_USER_BY_USERNAME
+    row = conn.execute(sql, (username,)).fetchone()
     return row_to_dict(row)
 
 
 def authenticate(conn: sqlite3.Connection, username: str, password: str) -> dict[str, Any]:
-    user = get_user_by_username(conn, username)
+    user = get_user_by_username(conn, username, include_secret=True)
     if not user or not user["is_active"]:
         raise AppError("Invalid credentials", 401)
-    if not verify_password(password, user["password_hash"]):
+    valid, new_hash = verify_and_update_password(password, user["password_hash"])
+    if not valid:
         raise AppError("Invalid credentials", 401)
+    if new_hash:
+        conn.execute("UPDATE users SET password_hash = ? WHERE id = ?", (new_hash, user["id"]))
+    del user["password_hash"]
     return user
 
 
@@ -55,21 +173,22 @@ def create_user(
     password: str,
     avatar: str,
 ) -> dict[str, Any]:
-    if role not in {ROLE_ADMIN, ROLE_PARENT, ROLE_CHILD}:
+    if role not in ALL_ROLES:
         raise AppError("Invalid role")
     if not username or not password or not display_name:
         raise AppError("username, display_name and password are required")
 
     try:
-        cur = conn.execute(
+        return _insert_returning(
+            conn,
+            "users",
+            _USER_COLUMNS,
             """
             INSERT INTO users (username, display_name, role, password_hash, avatar, is_active, must_change_password, created_at)
             VALUES (?, ?, ?, ?, ?, 1, 0, ?)
             """,
             (username.strip(), display_name.strip(), role, hash_password(password), avatar or "🙂", now_iso()),
         )
-        conn.commit()
-        return get_user(conn, int(cur.lastrowid))  # type: ignore[arg-type]
     except sqlite3.IntegrityError:
         raise AppError("Username already exists", 409)
 
@@ -79,9 +198,8 @@ def patch_user(conn: sqlite3.Connection, user_id: int, data: dict[str, Any]) ->
     if not user:
         raise AppError("User not found", 404)
 
-    allowed = {"display_name", "role", "avatar", "is_active", "must_change_password"}
-    updates = {k: v for k, v in data.items() if k in allowed}
-    if "role" in updates and updates["role"] not in {ROLE_ADMIN, ROLE_PARENT, ROLE_CHILD}:
+    updates = {k: v for k, v in data.items() if k in _PATCHABLE_USER_FIELDS}
+    if "role" in updates and updates["role"] not in ALL_ROLES:
         raise AppError("Invalid role")
 
     if not updates:
@@ -90,7 +208,6 @@ def patch_user(conn: sqlite3.Connection, user_id: int, data: dict[str, Any]) ->
     sets = ", ".join([f"{k} = ?" for k in updates.keys()])
     values = list(updates.values()) + [user_id]
     conn.execute(f"UPDATE users SET {sets} WHERE id = ?", values)
-    conn.commit()
     return get_user(conn, user_id)  # type: ignore[return-value]
 
 
@@ -104,11 +221,10 @@ def reset_password(conn: sqlite3.Connection, user_id: int, new_password: str) ->
         "UPDATE users SET password_hash = ?, must_change_password = 1 WHERE id = ?",
         (hash_password(new_password), user_id),
     )
-    conn.commit()
 
 
 def change_password(conn: sqlite3.Connection, user_id: int, old_password: str, new_password: str) -> None:
-    user = get_user(conn, user_id)
+    user = get_user(conn, user_id, include_secret=True)
     if not user:
         raise AppError("User not found", 404)
     if not verify_password(old_password, user["password_hash"]):
@@ -119,11 +235,10 @@ def change_password(conn: sqlite3.Connection, user_id: int, old_password: str, n
         "UPDATE users SET password_hash = ?, must_change_password = 0 WHERE id = ?",
         (hash_password(new_password), user_id),
     )
-    conn.commit()
 
 
 def get_points_total(conn: sqlite3.Connection, user_id: int) -> int:
-    row = conn.execute("SELECT COALESCE(SUM(delta), 0) AS total FROM ledger WHERE user_id = ?", (user_id,)).fetchone()
+    row = conn.execute(_SQL_POINTS_TOTAL, (user_id,)).fetchone()
     return int(row["total"]) if row else 0
 
 
@@ -134,20 +249,24 @@ def add_ledger_entry(
     reason: str,
     ref_type: str,
     ref_id: int | None,
+    created_at: str | None = None,
 ) -> int:
-    cur = conn.execute(
-        "INSERT INTO ledger (user_id, delta, reason, ref_type, ref_id, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-        (user_id, delta, reason, ref_type, ref_id, now_iso()),
-    )
+    # Never commits: callers run it inside their own txn() alongside the change it records.
+    cur = conn.execute(_SQL_INSERT_LEDGER, (user_id, delta, reason, ref_type, ref_id, created_at or now_iso()))
     return int(cur.lastrowid)
 
 
-def list_ledger(conn: sqlite3.Connection, user_id: int) -> list[dict[str, Any]]:
-    rows = conn.execute(
-        "SELECT id, user_id, delta, reason, ref_type, ref_id, created_at FROM ledger WHERE user_id = ? ORDER BY id DESC",
-        (user_id,),
-    ).fetchall()
-    return [row_to_dict(r) for r in rows]
+_LEDGER_BATCH = 200
+
+
+def list_ledger(conn: sqlite3.Connection, user_id: int) -> Iterator[dict[str, Any]]:
+    # Streams in batches; consume it while the request connection is still held.
+    cur = conn.execute(_SQL_LIST_LEDGER, (user_id,))
+    cur.row_factory = None
+    cols = [d[0] for d in cur.description]
+    for batch in iter(lambda: cur.fetchmany(_LEDGER_BATCH), []):
+        for r in batch:
+            yield dict(zip(cols, r))
 
 
 def create_chore(
@@ -160,55 +279,116 @@ def create_chore(
     recurrence: str,
     due_date: str | None,
 ) -> dict[str, Any]:
-    if actor["role"] not in {ROLE_ADMIN, ROLE_PARENT}:
+    if actor["role"] not in PARENT_OR_ADMIN:
         raise AppError("Not allowed", 403)
     if not title:
         raise AppError("title is required")
     if points < 0:
         raise AppError("points must be >= 0")
-    if recurrence not in {"NONE", "DAILY", "WEEKLY"}:
+    if recurrence not in _RECURRENCES:
         raise AppError("invalid recurrence")
     if not assignee_ids:
         raise AppError("At least one assignee is required")
 
-    # Validate assignees are CHILD users.
-    q = ",".join(["?"] * len(assignee_ids))
-    rows = conn.execute(f"SELECT id, role, is_active FROM users WHERE id IN ({q})", assignee_ids).fetchall()
-    if len(rows) != len(set(assignee_ids)):
-        raise AppError("Invalid assignee(s)")
-    for r in rows:
-        if r["role"] != ROLE_CHILD or not r["is_active"]:
-            raise AppError("Assignees must be active CHILD users")
+    with txn(conn):
+        # Validate assignees are CHILD users. Passing the ids as one JSON array
+        # keeps the SQL text fixed, so the prepared statement is reused for any count.
+        unique_ids = sorted(set(assignee_ids))
+        rows = conn.execute(
+            """
+            SELECT id, username, display_name, avatar, role, is_active
+            FROM users
+            WHERE id IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(unique_ids),),
+        ).fetchall()
+        if len(rows) != len(unique_ids):
+            raise AppError("Invalid assignee(s)")
+        for r in rows:
+            if r["role"] != ROLE_CHILD or not r["is_active"]:
+                raise AppError("Assignees must be active CHILD users")
+
+        ts = now_iso()
+        chore = _insert_returning(
+            conn,
+            "chores",
+            _CHORE_COLUMNS,
+            """
+            INSERT INTO chores (title, description, points, recurrence, due_date, status, created_by, created_at)
+            VALUES (?, ?, ?, ?, ?, 'ASSIGNED', ?, ?)
+            """,
+            (title.strip(), (description or "").strip(), points, recurrence, due_date, actor["id"], ts),
+        )
+        chore_id = chore["id"]
+        conn.executemany(
+            "INSERT INTO chore_assignments (chore_id, user_id) VALUES (?, ?)",
+            [(chore_id, uid) for uid in unique_ids],
+        )
+        cur = conn.execute(
+            "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (chore_id, None, "ASSIGNED", actor["id"], "Chore created", ts),
+        )
+        event_id = int(cur.lastrowid)
 
-    cur = conn.execute(
-        """
-        INSERT INTO chores (title, description, points, recurrence, due_date, status, created_by, created_at)
-        VALUES (?, ?, ?, ?, ?, 'ASSIGNED', ?, ?)
-        """,
-        (title.strip(), (description or "").strip(), points, recurrence, due_date, actor["id"], now_iso()),
+    # Same shape as get_chore, assembled from what was just validated and written.
+    chore["assignees"] = sorted(
+        ({"id": r["id"], "username": r["username"], "display_name": r["display_name"], "avatar": r["avatar"]} for r in rows),
+        key=lambda a: a["display_name"],
     )
-    chore_id = int(cur.lastrowid)
-    for uid in sorted(set(assignee_ids)):
-        conn.execute("INSERT INTO chore_assignments (chore_id, user_id) VALUES (?, ?)", (chore_id, uid))
-    conn.execute(
-        "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-        (chore_id, None, "ASSIGNED", actor["id"], "Chore created", now_iso()),
-    )
-    conn.commit()
-    return get_chore(conn, chore_id)
+    chore["events"] = [_chore_event(event_id, None, "ASSIGNED", actor, "Chore created", ts)]
+    return chore
+
+
+def _chore_event(
+    event_id: int,
+    from_status: str | None,
+    to_status: str,
+    actor: dict[str, Any],
+    note: str,
+    created_at: str,
+) -> dict[str, Any]:
+    """Build an entry shaped like get_chore's ``events`` rows for an event just inserted."""
+    return {
+        "id": event_id,
+        "from_status": from_status,
+        "to_status": to_status,
+        "actor_user_id": actor["id"],
+        "actor_name": actor["display_name"],
+        "note": note,
+        "created_at": created_at,
+    }
 
 
 def _chore_assignee_ids(conn: sqlite3.Connection, chore_id: int) -> list[int]:
-    rows = conn.execute("SELECT user_id FROM chore_assignments WHERE chore_id = ?", (chore_id,)).fetchall()
+    rows = conn.execute(_SQL_CHORE_ASSIGNEE_IDS, (chore_id,)).fetchall()
     return [int(r["user_id"]) for r in rows]
 
 
-def get_chore(conn: sqlite3.Connection, chore_id: int) -> dict[str, Any]:
-    chore_row = conn.execute("SELECT * FROM chores WHERE id = ?", (chore_id,)).fetchone()
+def _chore_with_assignees(chore: dict[str, Any]) -> dict[str, Any]:
+    aids = chore.pop("aids")
+    chore["assignees"] = sorted(int(x) for x in aids.split(",")) if aids else []
+    return chore
+
+
+def get_chore(conn: sqlite3.Connection, chore_id: int, viewer_id: int | None = None) -> dict[str, Any]:
+    if viewer_id is None:
+        chore_row = conn.execute(f"SELECT {_CHORE_COLUMNS} FROM chores WHERE id = ?", (chore_id,)).fetchone()
+    else:
+        chore_row = conn.execute(
+            f"""
+            SELECT {_CHORE_COLUMNS_C}, EXISTS (
+                SELECT 1 FROM chore_assignments WHERE chore_id = c.id AND user_id = ?
+            ) AS is_assignee
+            FROM chores c
+            WHERE c.id = ?
+            """,
+            (viewer_id, chore_id),
+        ).fetchone()
     if not chore_row:
         raise AppError("Chore not found", 404)
     chore = row_to_dict(chore_row)
-    assignees = conn.execute(
+    chore["assignees"] = _fetchall_dicts(
+        conn,
         """
         SELECT u.id, u.username, u.display_name, u.avatar
         FROM chore_assignments ca
@@ -217,9 +397,9 @@ def get_chore(conn: sqlite3.Connection, chore_id: int) -> dict[str, Any]:
         ORDER BY u.display_name
         """,
         (chore_id,),
-    ).fetchall()
-    chore["assignees"] = [row_to_dict(r) for r in assignees]
-    events = conn.execute(
+    )
+    chore["events"] = _fetchall_dicts(
+        conn,
         """
         SELECT ce.id, ce.from_status, ce.to_status, ce.actor_user_id, u.display_name AS actor_name, ce.note, ce.created_at
         FROM chore_events ce
@@ -228,16 +408,11 @@ def get_chore(conn: sqlite3.Connection, chore_id: int) -> dict[str, Any]:
         ORDER BY ce.id DESC
         """,
         (chore_id,),
-    ).fetchall()
-    chore["events"] = [row_to_dict(r) for r in events]
+    )
     return chore
 
 
-def list_chores(
-    conn: sqlite3.Connection,
-    actor: dict[str, Any],
-    status: str | None = None,
-) -> list[dict[str, Any]]:
+def _chore_filters(actor: dict[str, Any], status: str | None) -> tuple[str, list[Any]]:
     params: list[Any] = []
     where = ["1=1"]
     if status:
@@ -245,53 +420,104 @@ def list_chores(
         params.append(status)
 
     if actor["role"] == ROLE_CHILD:
-        where.append("ca.user_id = ?")
+        # EXISTS rather than filtering the join, so the aggregated assignees stay complete.
+        where.append("EXISTS (SELECT 1 FROM chore_assignments WHERE chore_id = c.id AND user_id = ?)")
         params.append(actor["id"])
 
     # Future recurring chores should only appear on/after due_date.
     where.append("NOT (c.status = 'ASSIGNED' AND c.due_date IS NOT NULL AND c.due_date > ?)")
     params.append(datetime.now(timezone.utc).date().isoformat())
+    return " AND ".join(where), params
 
-    rows = conn.execute(
+
+def list_chores(
+    conn: sqlite3.Connection,
+    actor: dict[str, Any],
+    status: str | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    where, params = _chore_filters(actor, status)
+    limit_sql = ""
+    if limit is not None:
+        limit_sql = "LIMIT ?"
+        params.append(limit)
+
+    rows = _fetchall_dicts(
+        conn,
         f"""
-        SELECT DISTINCT c.*
+        SELECT {_CHORE_COLUMNS_C}, GROUP_CONCAT(ca.user_id) AS aids
         FROM chores c
         JOIN chore_assignments ca ON ca.chore_id = c.id
-        WHERE {' AND '.join(where)}
+        WHERE {where}
+        GROUP BY c.id
         ORDER BY c.id DESC
+        {limit_sql}
         """,
         params,
-    ).fetchall()
+    )
+    return [_chore_with_assignees(r) for r in rows]
 
-    result: list[dict[str, Any]] = []
-    for r in rows:
-        chore = row_to_dict(r)
-        chore["assignees"] = _chore_assignee_ids(conn, chore["id"])
-        result.append(chore)
-    return result
+
+def list_chores_json(conn: sqlite3.Connection, actor: dict[str, Any], status: str | None = None) -> str:
+    if not HAS_AGGREGATE_ORDER_BY:
+        # Without ORDER BY inside json_group_array the assignee order isn't pinned.
+        return json.dumps(list_chores(conn, actor, status=status), ensure_ascii=False, separators=(",", ":"))
+    where, params = _chore_filters(actor, status)
+    return _fetch_json_array(
+        conn,
+        f"""
+        SELECT {_CHORE_COLUMNS_C},
+               (SELECT json_group_array(user_id ORDER BY user_id)
+                FROM chore_assignments WHERE chore_id = c.id) AS assignees
+        FROM chores c
+        WHERE {where} AND EXISTS (SELECT 1 FROM chore_assignments WHERE chore_id = c.id)
+        """,
+        params,
+        _CHORE_FIELDS + ("assignees",),
+        order_by="id DESC",
+        json_fields=("assignees",),
+    )
+
+
+def count_chores(conn: sqlite3.Connection, actor: dict[str, Any], status: str | None = None) -> int:
+    where, params = _chore_filters(actor, status)
+    row = conn.execute(
+        f"""
+        SELECT COUNT(DISTINCT c.id)
+        FROM chores c
+        JOIN chore_assignments ca ON ca.chore_id = c.id
+        WHERE {where}
+        """,
+        params,
+    ).fetchone()
+    return int(row[0])
 
 
 def mark_chore_done(conn: sqlite3.Connection, actor: dict[str, Any], chore_id: int) -> dict[str, Any]:
     if actor["role"] != ROLE_CHILD:
         raise AppError("Only CHILD can mark done", 403)
-    chore = get_chore(conn, chore_id)
-    assignee_ids = [a["id"] for a in chore["assignees"]]
-    if actor["id"] not in assignee_ids:
-        raise AppError("Not assigned to this chore", 403)
-    if chore["due_date"]:
-        today = datetime.now(timezone.utc).date().isoformat()
-        if chore["due_date"] > today:
-            raise AppError("Chore is not available yet", 400)
-    if chore["status"] not in {"ASSIGNED", "REJECTED"}:
-        raise AppError("Chore cannot be marked done now", 400)
-
-    conn.execute("UPDATE chores SET status = 'DONE_PENDING' WHERE id = ?", (chore_id,))
-    conn.execute(
-        "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, ?, 'DONE_PENDING', ?, ?, ?)",
-        (chore_id, chore["status"], actor["id"], "Marked done", now_iso()),
-    )
-    conn.commit()
-    return get_chore(conn, chore_id)
+    with txn(conn):
+        chore = get_chore(conn, chore_id, viewer_id=actor["id"])
+        if not chore["is_assignee"]:
+            raise AppError("Not assigned to this chore", 403)
+        if chore["due_date"]:
+            today = datetime.now(timezone.utc).date().isoformat()
+            if chore["due_date"] > today:
+                raise AppError("Chore is not available yet", 400)
+        if chore["status"] not in _MARKABLE_STATUSES:
+            raise AppError("Chore cannot be marked done now", 400)
+
+        ts = now_iso()
+        conn.execute("UPDATE chores SET status = 'DONE_PENDING' WHERE id = ?", (chore_id,))
+        cur = conn.execute(
+            "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, ?, 'DONE_PENDING', ?, ?, ?)",
+            (chore_id, chore["status"], actor["id"], "Marked done", ts),
+        )
+
+    del chore["is_assignee"]
+    chore["events"].insert(0, _chore_event(int(cur.lastrowid), chore["status"], "DONE_PENDING", actor, "Marked done", ts))
+    chore["status"] = "DONE_PENDING"
+    return chore
 
 
 def _pending_actor_for_chore(conn: sqlite3.Connection, chore_id: int) -> int | None:
@@ -307,109 +533,143 @@ def _pending_actor_for_chore(conn: sqlite3.Connection, chore_id: int) -> int | N
     return int(row["actor_user_id"]) if row else None
 
 
-def _next_due_date(current: str | None, recurrence: str) -> str | None:
-    if recurrence not in {"DAILY", "WEEKLY"}:
-        return current
-    today = datetime.now(timezone.utc).date()
-    base = today
-    if current:
-        try:
-            parsed = datetime.strptime(current, "%Y-%m-%d").date()
-            if parsed > base:
-                base = parsed
-        except ValueError:
-            base = today
-    if recurrence == "DAILY":
-        return (base + timedelta(days=1)).isoformat()
-    if recurrence == "WEEKLY":
-        return (base + timedelta(weeks=1)).isoformat()
-    return None
-
-
-def _create_next_recurrence(conn: sqlite3.Connection, chore: dict[str, Any]) -> None:
-    if chore["recurrence"] not in {"DAILY", "WEEKLY"}:
+def _create_next_recurrence(conn: sqlite3.Connection, chore: dict[str, Any], ts: str) -> None:
+    if chore["recurrence"] not in _REPEATING:
         return
-    assignee_ids = _chore_assignee_ids(conn, chore["id"])
+    # Next due date: one day/week after the later of today (UTC) and the current
+    # due date; an unparseable due date counts as today.
     cur = conn.execute(
         """
         INSERT INTO chores (title, description, points, recurrence, due_date, status, created_by, created_at)
-        VALUES (?, ?, ?, ?, ?, 'ASSIGNED', ?, ?)
+        VALUES (
+            ?, ?, ?, ?,
+            date(
+                max(date('now'), COALESCE(date(?), date('now'))),
+                CASE ? WHEN 'DAILY' THEN '+1 day' ELSE '+7 days' END
+            ),
+            'ASSIGNED', ?, ?
+        )
         """,
         (
             chore["title"],
             chore["description"],
             chore["points"],
             chore["recurrence"],
-            _next_due_date(chore["due_date"], chore["recurrence"]),
+            chore["due_date"],
+            chore["recurrence"],
             chore["created_by"],
-            now_iso(),
+            ts,
         ),
     )
     next_id = int(cur.lastrowid)
-    for uid in assignee_ids:
-        conn.execute("INSERT INTO chore_assignments (chore_id, user_id) VALUES (?, ?)", (next_id, uid))
+    # Copy the assignees in one statement instead of reading them back and inserting per row.
+    conn.execute(
+        "INSERT INTO chore_assignments (chore_id, user_id) SELECT ?, user_id FROM chore_assignments WHERE chore_id = ?",
+        (next_id, chore["id"]),
+    )
     conn.execute(
         "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-        (next_id, None, "ASSIGNED", chore["created_by"], "Auto-created recurrence", now_iso()),
+        (next_id, None, "ASSIGNED", chore["created_by"], "Auto-created recurrence", ts),
     )
 
 
 def approve_chore(conn: sqlite3.Connection, actor: dict[str, Any], chore_id: int, note: str | None = None) -> dict[str, Any]:
-    if actor["role"] not in {ROLE_ADMIN, ROLE_PARENT}:
+    if actor["role"] not in PARENT_OR_ADMIN:
         raise AppError("Not allowed", 403)
-    chore = get_chore(conn, chore_id)
-    if chore["status"] != "DONE_PENDING":
-        raise AppError("Chore is not pending", 400)
-
-    child_id = _pending_actor_for_chore(conn, chore_id)
-    if not child_id:
-        assignees = _chore_assignee_ids(conn, chore_id)
-        child_id = assignees[0] if assignees else None
-    if not child_id:
-        raise AppError("No assignee found", 400)
-
-    conn.execute("UPDATE chores SET status = 'APPROVED' WHERE id = ?", (chore_id,))
-    conn.execute(
-        "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, 'DONE_PENDING', 'APPROVED', ?, ?, ?)",
-        (chore_id, actor["id"], note or "Approved", now_iso()),
-    )
-    add_ledger_entry(conn, child_id, int(chore["points"]), f"Chore approved: {chore['title']}", "CHORE", chore_id)
-    _create_next_recurrence(conn, chore)
-    conn.commit()
-    return get_chore(conn, chore_id)
+    with txn(conn):
+        chore = get_chore(conn, chore_id)
+        if chore["status"] != "DONE_PENDING":
+            raise AppError("Chore is not pending", 400)
+
+        child_id = _pending_actor_for_chore(conn, chore_id)
+        if not child_id:
+            assignees = _chore_assignee_ids(conn, chore_id)
+            child_id = assignees[0] if assignees else None
+        if not child_id:
+            raise AppError("No assignee found", 400)
+
+        ts = now_iso()
+        conn.execute("UPDATE chores SET status = 'APPROVED' WHERE id = ?", (chore_id,))
+        cur = conn.execute(
+            "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, 'DONE_PENDING', 'APPROVED', ?, ?, ?)",
+            (chore_id, actor["id"], note or "Approved", ts),
+        )
+        event_id = int(cur.lastrowid)
+        add_ledger_entry(conn, child_id, int(chore["points"]), f"Chore approved: {chore['title']}", "CHORE", chore_id, ts)
+        _create_next_recurrence(conn, chore, ts)
+
+    chore["events"].insert(0, _chore_event(event_id, "DONE_PENDING", "APPROVED", actor, note or "Approved", ts))
+    chore["status"] = "APPROVED"
+    return chore
 
 
 def reject_chore(conn: sqlite3.Connection, actor: dict[str, Any], chore_id: int, note: str | None = None) -> dict[str, Any]:
-    if actor["role"] not in {ROLE_ADMIN, ROLE_PARENT}:
+    if actor["role"] not in PARENT_OR_ADMIN:
         raise AppError("Not allowed", 403)
-    chore = get_chore(conn, chore_id)
-    if chore["status"] != "DONE_PENDING":
-        raise AppError("Chore is not pending", 400)
+    with txn(conn):
+        chore = get_chore(conn, chore_id)
+        if chore["status"] != "DONE_PENDING":
+            raise AppError("Chore is not pending", 400)
 
-    conn.execute("UPDATE chores SET status = 'REJECTED' WHERE id = ?", (chore_id,))
-    conn.execute(
-        "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, 'DONE_PENDING', 'REJECTED', ?, ?, ?)",
-        (chore_id, actor["id"], note or "Rejected", now_iso()),
-    )
-    conn.commit()
-    return get_chore(conn, chore_id)
+        ts = now_iso()
+        conn.execute("UPDATE chores SET status = 'REJECTED' WHERE id = ?", (chore_id,))
+        cur = conn.execute(
+            "INSERT INTO chore_events (chore_id, from_status, to_status, actor_user_id, note, created_at) VALUES (?, 'DONE_PENDING', 'REJECTED', ?, ?, ?)",
+            (chore_id, actor["id"], note or "Rejected", ts),
+        )
+
+    chore["events"].insert(0, _chore_event(int(cur.lastrowid), "DONE_PENDING", "REJECTED", actor, note or "Rejected", ts))
+    chore["status"] = "REJECTED"
+    return chore
 
 
 def approvals_queue(conn: sqlite3.Connection) -> list[dict[str, Any]]:
-    rows = conn.execute(
-        """
-        SELECT c.*
+    # Flat chore x assignee rows, grouped into one dict per chore in a single pass.
+    cur = conn.execute(
+        f"""
+        SELECT {_CHORE_COLUMNS_C}, ca.user_id
         FROM chores c
+        LEFT JOIN chore_assignments ca ON ca.chore_id = c.id
         WHERE c.status = 'DONE_PENDING'
-        ORDER BY c.id ASC
+        ORDER BY c.id ASC, ca.user_id ASC
         """
+    )
+    cur.row_factory = None
+    queue: dict[int, dict[str, Any]] = {}
+    for *chore, user_id in cur:
+        item = queue.get(chore[0])
+        if item is None:
+            item = queue[chore[0]] = dict(zip(_CHORE_FIELDS, chore))
+            item["assignees"] = []
+        if user_id is not None:
+            item["assignees"].append(user_id)
+    return list(queue.values())
+
+
+def dashboard_parent_bundle(conn: sqlite3.Connection) -> dict[str, Any]:
+    # One row per active child with their points; the single-row pending count
+    # is the left side so it survives a family with no children yet.
+    rows = conn.execute(
+        """
+        SELECT p.pending_count,
+               u.id, u.username, u.display_name, u.role, u.avatar, u.is_active, u.must_change_password, u.created_at,
+               COALESCE(SUM(l.delta), 0) AS points
+        FROM (SELECT COUNT(*) AS pending_count FROM chores WHERE status = 'DONE_PENDING') p
+        LEFT JOIN users u ON u.role = ? AND u.is_active = 1
+        LEFT JOIN ledger l ON l.user_id = u.id
+        GROUP BY u.id
+        ORDER BY u.id
+        """,
+        (ROLE_CHILD,),
     ).fetchall()
-    out = []
+    child_points = []
     for r in rows:
-        chore = row_to_dict(r)
-        chore["assignees"] = _chore_assignee_ids(conn, chore["id"])
-        out.append(chore)
-    return out
+        if r["id"] is None:
+            continue
+        user = row_to_dict(r)
+        del user["pending_count"], user["points"]
+        child_points.append({"user": user, "points": int(r["points"])})
+    return {"child_points": child_points, "pending_count": int(rows[0]["pending_count"])}
 
 
 def create_reward(
@@ -420,76 +680,147 @@ def create_reward(
     is_active: bool,
     limit_per_week: int | None,
 ) -> dict[str, Any]:
-    if actor["role"] not in {ROLE_ADMIN, ROLE_PARENT}:
+    if actor["role"] not in PARENT_OR_ADMIN:
         raise AppError("Not allowed", 403)
     if not name:
         raise AppError("name is required")
     if cost < 0:
         raise AppError("cost must be >=0")
-    cur = conn.execute(
+    reward = _insert_returning(
+        conn,
+        "rewards",
+        _REWARD_COLUMNS,
         "INSERT INTO rewards (name, cost, is_active, limit_per_week, created_by, created_at) VALUES (?, ?, ?, ?, ?, ?)",
         (name.strip(), cost, 1 if is_active else 0, limit_per_week, actor["id"], now_iso()),
     )
-    conn.commit()
-    return get_reward(conn, int(cur.lastrowid))
+    _invalidate_rewards()
+    return reward
 
 
 def get_reward(conn: sqlite3.Connection, reward_id: int) -> dict[str, Any]:
-    row = conn.execute("SELECT * FROM rewards WHERE id = ?", (reward_id,)).fetchone()
+    row = conn.execute(f"SELECT {_REWARD_COLUMNS} FROM rewards WHERE id = ?", (reward_id,)).fetchone()
     if not row:
         raise AppError("Reward not found", 404)
     return row_to_dict(row)
 
 
-def list_rewards(conn: sqlite3.Connection) -> list[dict[str, Any]]:
-    rows = conn.execute("SELECT * FROM rewards ORDER BY id DESC").fetchall()
-    return [row_to_dict(r) for r in rows]
+# Rewards change rarely but are read on every child dashboard, so listings are
+# cached in-process, per database file. Every write to the rewards table must
+# call _invalidate_rewards() (today that is only create_reward); the TTL bounds
+# staleness when several worker processes share the database.
+_REWARDS_TTL_SECONDS = 30.0
+_rewards_version = 0
+_rewards_cache: dict[tuple[str, bool], tuple[int, float, list[dict[str, Any]]]] = {}
 
 
-def _start_of_week_utc() -> str:
-    now = datetime.now(timezone.utc)
-    start = (now - timedelta(days=now.weekday())).date()
-    return datetime.combine(start, datetime.min.time(), timezone.utc).isoformat()
+def _invalidate_rewards() -> None:
+    global _rewards_version
+    _rewards_version += 1
 
 
-def request_redemption(conn: sqlite3.Connection, actor: dict[str, Any], reward_id: int) -> dict[str, Any]:
-    if actor["role"] != ROLE_CHILD:
-        raise AppError("Only CHILD can redeem", 403)
-    reward = get_reward(conn, reward_id)
-    if not reward["is_active"]:
-        raise AppError("Reward is inactive", 400)
+def _database_key(conn: sqlite3.Connection) -> str:
+    # File of the "main" database; in-memory databases fall back to the connection.
+    row = conn.execute("PRAGMA database_list").fetchone()
+    return row[2] or f"memory:{id(conn)}"
 
-    total = get_points_total(conn, actor["id"])
-    if total < reward["cost"]:
-        raise AppError("Not enough points", 400)
 
-    if reward["limit_per_week"] is not None:
-        row = conn.execute(
-            """
-            SELECT COUNT(*) AS c
-            FROM redemptions
-            WHERE user_id = ? AND reward_id = ? AND status = 'APPROVED' AND created_at >= ?
-            """,
-            (actor["id"], reward_id, _start_of_week_utc()),
-        ).fetchone()
-        if int(row["c"]) >= int(reward["limit_per_week"]):
-            raise AppError("Weekly limit reached", 400)
+def list_rewards(conn: sqlite3.Connection, active_only: bool = False, limit: int | None = None) -> list[dict[str, Any]]:
+    # limit slices the cached listing, so both variants share one cache entry.
+    # Callers get fresh dicts so mutating a result can't corrupt the cache.
+    now = time.monotonic()
+    key = (_database_key(conn), active_only)
+    cached = _rewards_cache.get(key)
+    if cached and cached[0] == _rewards_version and cached[1] > now:
+        return [dict(r) for r in cached[2][:limit]]
 
-    cur = conn.execute(
+    version = _rewards_version
+    if active_only:
+        rewards = _fetchall_dicts(conn, f"SELECT {_REWARD_COLUMNS} FROM rewards WHERE is_active = 1 ORDER BY id DESC")
+    else:
+        rewards = _fetchall_dicts(conn, f"SELECT {_REWARD_COLUMNS} FROM rewards ORDER BY id DESC")
+    _rewards_cache[key] = (version, now + _REWARDS_TTL_SECONDS, rewards)
+    return [dict(r) for r in rewards[:limit]]
+
+
+@lru_cache(maxsize=1)
+def _week_start_iso(monday_ordinal: int) -> str:
+    return datetime.combine(date.fromordinal(monday_ordinal), datetime.min.time(), timezone.utc).isoformat()
+
+
+def _start_of_week_utc() -> str:
+    # Only rebuilt when the (UTC) week rolls over.
+    today = datetime.now(timezone.utc).date()
+    return _week_start_iso(today.toordinal() - today.weekday())
+
+
+def _redemption_refusal(conn: sqlite3.Connection, actor: dict[str, Any], reward_id: int) -> AppError:
+    """Explain why the guarded INSERT in request_redemption wrote no row."""
+    reward = conn.execute(
         """
-        INSERT INTO redemptions (reward_id, user_id, status, note, created_at, updated_at, handled_by)
-        VALUES (?, ?, 'REQUESTED', ?, ?, ?, NULL)
+        SELECT rw.is_active, rw.cost, rw.limit_per_week,
+               (SELECT COALESCE(SUM(delta), 0) FROM ledger WHERE user_id = ?) AS balance,
+               (SELECT COUNT(*) FROM redemptions
+                WHERE user_id = ? AND reward_id = rw.id AND status = 'APPROVED' AND created_at >= ?) AS weekly_count
+        FROM rewards rw
+        WHERE rw.id = ?
         """,
-        (reward_id, actor["id"], "Requested by child", now_iso(), now_iso()),
-    )
-    conn.commit()
-    return get_redemption(conn, int(cur.lastrowid))
+        (actor["id"], actor["id"], _start_of_week_utc(), reward_id),
+    ).fetchone()
+    if not reward:
+        return AppError("Reward not found", 404)
+    if not reward["is_active"]:
+        return AppError("Reward is inactive", 400)
+    if reward["balance"] < reward["cost"]:
+        return AppError("Not enough points", 400)
+    if reward["limit_per_week"] is not None and reward["weekly_count"] >= reward["limit_per_week"]:
+        return AppError("Weekly limit reached", 400)
+    return AppError("Redemption could not be requested", 400)
+
+
+# Inserts only when the reward is active, affordable and under its weekly
+# limit, so the checks and the write are one statement.
+_SQL_REQUEST_REDEMPTION = """
+    INSERT INTO redemptions (reward_id, user_id, status, note, created_at, updated_at, handled_by)
+    SELECT rw.id, :uid, 'REQUESTED', 'Requested by child', :now, :now, NULL
+    FROM rewards rw
+    WHERE rw.id = :rid AND rw.is_active = 1
+      AND (SELECT COALESCE(SUM(delta), 0) FROM ledger WHERE user_id = :uid) >= rw.cost
+      AND (SELECT COUNT(*) FROM redemptions
+           WHERE user_id = :uid AND reward_id = :rid AND status = 'APPROVED' AND created_at >= :sow)
+          < COALESCE(rw.limit_per_week, 999999999)
+"""
+
+
+def request_redemption(conn: sqlite3.Connection, actor: dict[str, Any], reward_id: int) -> dict[str, Any]:
+    if actor["role"] != ROLE_CHILD:
+        raise AppError("Only CHILD can redeem", 403)
+    params = {"rid": reward_id, "uid": actor["id"], "now": now_iso(), "sow": _start_of_week_utc()}
+    with txn(conn):
+        if HAS_RETURNING:
+            rows = conn.execute(
+                _SQL_REQUEST_REDEMPTION
+                + f"""
+                RETURNING {_REDEMPTION_COLUMNS},
+                          (SELECT name FROM rewards WHERE id = reward_id) AS reward_name,
+                          (SELECT cost FROM rewards WHERE id = reward_id) AS reward_cost
+                """,
+                params,
+            ).fetchall()
+            redemption = row_to_dict(rows[0]) if rows else None
+            if redemption is not None:
+                redemption["user_name"] = actor["display_name"]
+        else:
+            cur = conn.execute(_SQL_REQUEST_REDEMPTION, params)
+            redemption = get_redemption(conn, cur.lastrowid) if cur.rowcount else None
+        if redemption is None:
+            raise _redemption_refusal(conn, actor, reward_id)
+    return redemption
 
 
 def get_redemption(conn: sqlite3.Connection, redemption_id: int) -> dict[str, Any]:
     row = conn.execute(
-        """
-        SELECT r.*, rw.name AS reward_name, rw.cost AS reward_cost, u.display_name AS user_name
+        f"""
+        SELECT {_REDEMPTION_COLUMNS_R}
         FROM redemptions r
         JOIN rewards rw ON rw.id = r.reward_id
         JOIN users u ON u.id = r.user_id
@@ -502,64 +833,90 @@ def get_redemption(conn: sqlite3.Connection, redemption_id: int) -> dict[str, An
     return row_to_dict(row)
 
 
-def list_redemptions(conn: sqlite3.Connection, actor: dict[str, Any]) -> list[dict[str, Any]]:
+def _redemptions_sql(actor: dict[str, Any]) -> tuple[str, list[Any]]:
     params: list[Any] = []
     where = ""
     if actor["role"] == ROLE_CHILD:
         where = "WHERE r.user_id = ?"
         params.append(actor["id"])
-
-    rows = conn.execute(
-        f"""
-        SELECT r.*, rw.name AS reward_name, rw.cost AS reward_cost, u.display_name AS user_name
+    sql = f"""
+        SELECT {_REDEMPTION_COLUMNS_R}
         FROM redemptions r
         JOIN rewards rw ON rw.id = r.reward_id
         JOIN users u ON u.id = r.user_id
         {where}
         ORDER BY r.id DESC
-        """,
-        params,
-    ).fetchall()
-    return [row_to_dict(r) for r in rows]
+        """
+    return sql, params
 
 
-def approve_redemption(conn: sqlite3.Connection, actor: dict[str, Any], redemption_id: int, note: str | None = None) -> dict[str, Any]:
-    if actor["role"] not in {ROLE_ADMIN, ROLE_PARENT}:
-        raise AppError("Not allowed", 403)
-    redemption = get_redemption(conn, redemption_id)
-    if redemption["status"] != "REQUESTED":
-        raise AppError("Redemption not pending", 400)
+def list_redemptions(conn: sqlite3.Connection, actor: dict[str, Any]) -> list[dict[str, Any]]:
+    sql, params = _redemptions_sql(actor)
+    return _fetchall_dicts(conn, sql, params)
 
-    total = get_points_total(conn, redemption["user_id"])
-    if total < redemption["reward_cost"]:
-        raise AppError("Child no longer has enough points", 400)
 
-    conn.execute(
-        "UPDATE redemptions SET status = 'APPROVED', note = ?, updated_at = ?, handled_by = ? WHERE id = ?",
-        (note or "Approved", now_iso(), actor["id"], redemption_id),
-    )
-    add_ledger_entry(
-        conn,
-        redemption["user_id"],
-        -int(redemption["reward_cost"]),
-        f"Reward approved: {redemption['reward_name']}",
-        "REWARD",
-        redemption_id,
-    )
-    conn.commit()
+def list_redemptions_json(conn: sqlite3.Connection, actor: dict[str, Any]) -> str:
+    sql, params = _redemptions_sql(actor)
+    return _fetch_json_array(conn, sql, params, _REDEMPTION_FIELDS, order_by="id DESC")
+
+
+def rewards_page_bundle(conn: sqlite3.Connection, user: dict[str, Any]) -> dict[str, Any]:
+    with read_snapshot(conn):
+        return {
+            "rewards": list_rewards(conn),
+            "redemptions": list_redemptions(conn, user),
+            "points": get_points_total(conn, user["id"]),
+        }
+
+
+def approve_redemption(conn: sqlite3.Connection, actor: dict[str, Any], redemption_id: int, note: str | None = None) -> dict[str, Any]:
+    if actor["role"] not in PARENT_OR_ADMIN:
+        raise AppError("Not allowed", 403)
+    with txn(conn):
+        redemption = conn.execute(
+            """
+            SELECT r.status, r.user_id, rw.name AS reward_name, rw.cost AS reward_cost,
+                   (SELECT COALESCE(SUM(delta), 0) FROM ledger WHERE user_id = r.user_id) AS balance
+            FROM redemptions r
+            JOIN rewards rw ON rw.id = r.reward_id
+            WHERE r.id = ?
+            """,
+            (redemption_id,),
+        ).fetchone()
+        if not redemption:
+            raise AppError("Redemption not found", 404)
+        if redemption["status"] != "REQUESTED":
+            raise AppError("Redemption not pending", 400)
+        if redemption["balance"] < redemption["reward_cost"]:
+            raise AppError("Child no longer has enough points", 400)
+
+        ts = now_iso()
+        conn.execute(
+            "UPDATE redemptions SET status = 'APPROVED', note = ?, updated_at = ?, handled_by = ? WHERE id = ?",
+            (note or "Approved", ts, actor["id"], redemption_id),
+        )
+        add_ledger_entry(
+            conn,
+            redemption["user_id"],
+            -int(redemption["reward_cost"]),
+            f"Reward approved: {redemption['reward_name']}",
+            "REWARD",
+            redemption_id,
+            ts,
+        )
     return get_redemption(conn, redemption_id)
 
 
 def deny_redemption(conn: sqlite3.Connection, actor: dict[str, Any], redemption_id: int, note: str | None = None) -> dict[str, Any]:
-    if actor["role"] not in {ROLE_ADMIN, ROLE_PARENT}:
+    if actor["role"] not in PARENT_OR_ADMIN:
         raise AppError("Not allowed", 403)
-    redemption = get_redemption(conn, redemption_id)
-    if redemption["status"] != "REQUESTED":
-        raise AppError("Redemption not pending", 400)
-
-    conn.execute(
-        "UPDATE redemptions SET status = 'DENIED', note = ?, updated_at = ?, handled_by = ? WHERE id = ?",
-        (note or "Denied", now_iso(), actor["id"], redemption_id),
-    )
-    conn.commit()
+    with txn(conn):
+        redemption = get_redemption(conn, redemption_id)
+        if redemption["status"] != "REQUESTED":
+            raise AppError("Redemption not pending", 400)
+
+        conn.execute(
+            "UPDATE redemptions SET status = 'DENIED', note = ?, updated_at = ?, handled_by = ? WHERE id = ?",
+            (note or "Denied", now_iso(), actor["id"], redemption_id),
+        )
     return get_redemption(conn, redemption_id)
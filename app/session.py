@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SESSION_COOKIE = "session"
+SESSION_MAX_AGE = 14 * 24 * 60 * 60  # 14 days, in seconds
+
+
+class UserSession(dict):
+    """Session dict that remembers whether the request changed it."""
+
+    modified = False
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.modified = True
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.modified = True
+        super().__delitem__(key)
+
+    def clear(self) -> None:
+        self.modified = True
+        super().clear()
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self.modified = True
+        return super().pop(key, *default)
+
+
+class UserIdSessionMiddleware:
+    """Cookie session holding only ``user_id``, signed with itsdangerous.
+
+    The cookie is rewritten only on login/logout, or once its signature is past
+    half its lifetime so active users keep a sliding expiry. Other keys placed
+    in ``request.session`` are not persisted.
+    """
+
+    def __init__(self, app: ASGIApp, secret_key: str, same_site: str = "lax", https_only: bool = False):
+        self.app = app
+        self.serializer = URLSafeTimedSerializer(secret_key, salt="session")
+        self.security_flags = "httponly; samesite=" + same_site + ("; secure" if https_only else "")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        session = UserSession()
+        raw = HTTPConnection(scope).cookies.get(SESSION_COOKIE)
+        if raw:
+            try:
+                user_id, signed_at = self.serializer.loads(raw, max_age=SESSION_MAX_AGE, return_timestamp=True)
+            except BadSignature:
+                session.modified = True  # drop a stale or foreign cookie
+            else:
+                dict.__setitem__(session, "user_id", user_id)
+                if time.time() - signed_at.timestamp() > SESSION_MAX_AGE / 2:
+                    session.modified = True
+        scope["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and session.modified:
+                headers = MutableHeaders(scope=message)
+                user_id = session.get("user_id")
+                if user_id:
+                    value = self.serializer.dumps(user_id)
+                    headers.append(
+                        "Set-Cookie",
+                        f"{SESSION_COOKIE}={value}; path=/; Max-Age={SESSION_MAX_AGE}; {self.security_flags}",
+                    )
+                elif raw:
+                    headers.append(
+                        "Set-Cookie",
+                        f"{SESSION_COOKIE}=null; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT; {self.security_flags}",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
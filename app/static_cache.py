@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Only safe because every URL under these prefixes changes when its content does:
+# /static/* is referenced with ?v=<asset_version()> and Vite fingerprints /ui/assets/*.
+IMMUTABLE_PREFIXES = ("/static/", "/ui/assets/")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def asset_version(directory: str | Path) -> str:
+    """Short content hash of every file under ``directory``, used to bust caches."""
+    digest = hashlib.sha1()
+    for path in sorted(Path(directory).rglob("*")):
+        if path.is_file():
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:10]
+
+
+class StaticCacheMiddleware:
+    """Mark successful static asset responses as long-lived and immutable."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(IMMUTABLE_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] in (200, 304):
+                MutableHeaders(scope=message)["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
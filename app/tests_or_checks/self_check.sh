@@ -3,6 +3,7 @@ set -euo pipefail
 
 BASE_URL="${1:-http://localhost:8080}"
 COOKIE="/tmp/chorequest-cookie.txt"
+CHILD_COOKIE="/tmp/chorequest-child-cookie.txt"
 SUFFIX="$(date +%s)$RANDOM"
 PARENT_USER="parent_${SUFFIX}"
 CHILD_USER="child_${SUFFIX}"
@@ -32,4 +33,20 @@ curl -sS -b "$COOKIE" -H 'Content-Type: application/json' \
 grep -q '"role":"PARENT"\|"role": "PARENT"' /tmp/chq_parent.json
 grep -q '"role":"CHILD"\|"role": "CHILD"' /tmp/chq_child.json
 
+echo "[5] Child changes own password"
+curl -sS -c "$CHILD_COOKIE" -H 'Content-Type: application/json' \
+  -d "{\"username\":\"${CHILD_USER}\",\"password\":\"child123\"}" \
+  "$BASE_URL/api/login" >/dev/null
+curl -sS -o /dev/null -b "$CHILD_COOKIE" -D /tmp/chq_change_pw.txt \
+  --data-urlencode "old_password=child123" --data-urlencode "new_password=child456" \
+  "$BASE_URL/me/change-password"
+grep -qi '^location: /dashboard\s*$' /tmp/chq_change_pw.txt
+curl -sS -H 'Content-Type: application/json' \
+  -d "{\"username\":\"${CHILD_USER}\",\"password\":\"child456\"}" \
+  "$BASE_URL/api/login" | grep -q '"role":"CHILD"\|"role": "CHILD"'
+
+echo "[6] List endpoints keep their order"
+curl -sS -b "$COOKIE" "$BASE_URL/api/users" | grep -o '{"id": *[0-9]*' | grep -o '[0-9]*$' | sort -n -c
+curl -sS -b "$COOKIE" "$BASE_URL/api/chores" | grep -o '{"id": *[0-9]*' | grep -o '[0-9]*$' | sort -rn -c
+
 echo "Self-check passed."